@@ -14,6 +14,7 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, ServerCapabilities, TextContent
 
+from .utils.http import aclose_client
 from .tools import get_fingerprints, list_pipelines, get_logs, get_teams, get_metrics, get_metric_fields, get_metric_field_values, list_metrics, list_service_definitions, get_service_definition, list_monitors, get_monitor, monitor_edit, list_slos, get_logs_field_values, dashboard_update_title
 
 # Configure logging
@@ -150,6 +151,8 @@ async def async_main():
     except Exception as e:
         logger.error(f"Server startup failed: {e}")
         raise
+    finally:
+        await aclose_client()
 
 
 def cli_main():
@@ -0,0 +1,89 @@
+"""
+Shared results for monitor tool handlers
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+import fastjsonschema
+from fastjsonschema import JsonSchemaException
+from mcp.types import CallToolResult, TextContent
+
+
+def text_result(text: str, is_error: bool = False) -> CallToolResult:
+    """Build a CallToolResult with a single text block.
+
+    The fields are generated internally, so model_construct skips pydantic
+    validation.
+    """
+    return CallToolResult.model_construct(
+        content=[TextContent.model_construct(type="text", text=text)],
+        isError=is_error,
+    )
+
+
+def error_result(text: str) -> CallToolResult:
+    """Build an error CallToolResult with a single text block."""
+    return text_result(text, is_error=True)
+
+
+@lru_cache(maxsize=128)
+def _invalid_arguments_result(message: str) -> CallToolResult:
+    return error_result(f"Invalid arguments: {message}")
+
+
+def invalid_arguments_result(exc: JsonSchemaException) -> CallToolResult:
+    """Get the shared error result for arguments rejected by a tool's input schema.
+
+    Schema violations yield a small set of messages, so results are cached
+    per message like the fixed results below.
+    """
+    return _invalid_arguments_result(exc.message)
+
+
+def is_valid_monitor_id(monitor_id: Any) -> bool:
+    """Check that a monitor ID is a positive integer (bools excluded)."""
+    return isinstance(monitor_id, int) and not isinstance(monitor_id, bool) and monitor_id > 0
+
+
+# Fixed error results are built once and shared; handlers never mutate them
+INVALID_MONITOR_ID_RESULT = error_result("Error: monitor_id must be a positive integer")
+MONITOR_NOT_FOUND_RESULT = error_result("Monitor not found")
+PERMISSION_DENIED_RESULT = error_result("Permission denied")
+TIMEOUT_RESULT = error_result("Request timed out")
+
+HTTP_ERROR_RESULTS = {
+    404: MONITOR_NOT_FOUND_RESULT,
+    403: PERMISSION_DENIED_RESULT,
+}
+
+
+def compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Optional[CallToolResult]]:
+    """Compile a monitor tool's input schema into a single argument check.
+
+    Tools call this once at import so every handle_call rejects bad types,
+    out-of-range values and unknown fields before any Datadog request. The
+    schema is compiled once by fastjsonschema. The returned function
+    also requires a positive monitor_id, which the schema cannot express
+    for integral floats. Null arguments are treated as omitted, since MCP
+    clients often send null for optional fields.
+
+    Args:
+        schema: The tool's inputSchema; must require monitor_id
+
+    Returns:
+        A function returning an error result for invalid arguments, else None
+    """
+    validate = fastjsonschema.compile(schema, use_default=False)
+
+    def check(args: Dict[str, Any]) -> Optional[CallToolResult]:
+        args = {key: value for key, value in args.items() if value is not None}
+        try:
+            validate(args)
+        except JsonSchemaException as e:
+            return invalid_arguments_result(e)
+        if not is_valid_monitor_id(args["monitor_id"]):
+            return INVALID_MONITOR_ID_RESULT
+        return None
+
+    return check
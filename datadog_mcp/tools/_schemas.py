@@ -0,0 +1,20 @@
+"""
+Shared input schema fragments for monitor tools
+"""
+
+from typing import Any, Dict
+
+# Sub-schemas referenced by several tool definitions. They stay plain dicts
+# so Tool serializes them as JSON; treat them as read-only. Tools add their
+# own description to MONITOR_ID_SCHEMA.
+MONITOR_ID_SCHEMA: Dict[str, Any] = {
+    "type": "integer",
+    "minimum": 1,
+}
+
+FORMAT_SCHEMA: Dict[str, Any] = {
+    "type": "string",
+    "description": "Output format",
+    "enum": ["table", "json"],
+    "default": "table",
+}
@@ -2,40 +2,86 @@
 Get monitor tool
 """
 
-import json
 import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from mcp.types import CallToolRequest, CallToolResult, Tool, TextContent
+from mcp.types import CallToolRequest, CallToolResult, Tool
 import httpx
 
 logger = logging.getLogger(__name__)
 
 from ..utils.datadog_client import fetch_monitor
+from ..utils.monitor_cache import MONITOR_CACHE_MAXSIZE
+from ._common import (
+    HTTP_ERROR_RESULTS,
+    TIMEOUT_RESULT,
+    compile_validator,
+    error_result,
+    text_result,
+)
+from ._schemas import FORMAT_SCHEMA, MONITOR_ID_SCHEMA
 
+_HEADER = "Monitor Details\n" + "=" * 15 + "\n\n"
 
-def get_tool_definition() -> Tool:
-    """Get the tool definition for get_monitor."""
-    return Tool(
-        name="get_monitor",
-        description="Get details for a specific Datadog monitor by ID.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "monitor_id": {
-                    "type": "integer",
-                    "description": "The numeric ID of the monitor to fetch.",
-                },
-                "format": {
-                    "type": "string",
-                    "description": "Output format",
-                    "enum": ["table", "json"],
-                    "default": "table",
-                },
+# JSON encoder, resolved on first use so table-only callers skip the import
+_dumps: Optional[Callable[[Any], str]] = None
+
+
+def _json_dumps(monitor: Dict[str, Any]) -> str:
+    """Encode a monitor as indented JSON, preferring orjson when installed."""
+    global _dumps
+
+    if _dumps is None:
+        try:
+            import orjson
+
+            _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except ImportError:  # optional speedups extra
+            from json import dumps
+
+            _dumps = lambda obj: dumps(obj, indent=2)
+
+    return _dumps(monitor)
+
+
+# Rendered results keyed by (monitor_id, format), reused while fetch_monitor
+# keeps returning the same cached monitor object
+_rendered_results: "OrderedDict[Tuple[Any, str], Tuple[Dict[str, Any], CallToolResult]]" = OrderedDict()
+
+
+def _remember_result(key: Tuple[Any, str], monitor: Dict[str, Any], result: CallToolResult) -> None:
+    """Store a rendered result, evicting the least recently used."""
+    _rendered_results[key] = (monitor, result)
+    _rendered_results.move_to_end(key)
+    while len(_rendered_results) > MONITOR_CACHE_MAXSIZE:
+        _rendered_results.popitem(last=False)
+
+
+_TOOL_DEFINITION = Tool(
+    name="get_monitor",
+    description="Get details for a specific Datadog monitor by ID.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "monitor_id": {
+                **MONITOR_ID_SCHEMA,
+                "description": "The numeric ID of the monitor to fetch.",
             },
-            "additionalProperties": False,
-            "required": ["monitor_id"],
+            "format": FORMAT_SCHEMA,
         },
-    )
+        "additionalProperties": False,
+        "required": ["monitor_id"],
+    },
+)
+
+
+_VALIDATE = compile_validator(_TOOL_DEFINITION.inputSchema)
+
+
+def get_tool_definition() -> Tool:
+    """Get the tool definition for get_monitor."""
+    return _TOOL_DEFINITION
 
 
 async def handle_call(request: CallToolRequest) -> CallToolResult:
@@ -43,19 +89,23 @@ async def handle_call(request: CallToolRequest) -> CallToolResult:
     try:
         args = request.arguments or {}
 
-        monitor_id = args.get("monitor_id")
-        format_type = args.get("format", "table")
+        invalid = _VALIDATE(args)
+        if invalid is not None:
+            return invalid
 
-        if monitor_id is None:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: monitor_id is required")],
-                isError=True,
-            )
+        monitor_id = args["monitor_id"]
+        format_type = args.get("format") or "table"
 
         monitor = await fetch_monitor(monitor_id)
 
+        key = (monitor_id, format_type)
+        rendered = _rendered_results.get(key)
+        if rendered is not None and rendered[0] is monitor:
+            _rendered_results.move_to_end(key)
+            return rendered[1]
+
         if format_type == "json":
-            content = json.dumps(monitor, indent=2)
+            content = _json_dumps(monitor)
         else:
             monitor_name = monitor.get("name", "Unnamed")
             monitor_type = monitor.get("type", "unknown")
@@ -69,44 +119,40 @@ async def handle_call(request: CallToolRequest) -> CallToolResult:
             if len(tags) > 5:
                 tags_str += f" (+{len(tags) - 5} more)"
 
-            message_truncated = message[:100] + "..." if len(message) > 100 else message
-            message_truncated = message_truncated.replace("\n", " ")
-
-            content = f"Monitor Details\n"
-            content += "=" * 15 + "\n\n"
-            content += f"ID:       {monitor_id}\n"
-            content += f"Name:     {monitor_name}\n"
-            content += f"Type:     {monitor_type}\n"
-            content += f"State:    {overall_state}\n"
-            content += f"Priority: {priority}\n"
-            content += f"Tags:     {tags_str if tags_str else 'None'}\n"
-            content += f"Query:    {query}\n"
-            content += f"Message:  {message_truncated if message_truncated else 'None'}\n"
-
-        return CallToolResult(
-            content=[TextContent(type="text", text=content)],
-            isError=False,
-        )
+            if message:
+                message_truncated = message[:100].replace("\n", " ") + ("..." if len(message) > 100 else "")
+            else:
+                message_truncated = "None"
+
+            rows = [
+                f"ID:       {monitor_id}",
+                f"Name:     {monitor_name}",
+                f"Type:     {monitor_type}",
+                f"State:    {overall_state}",
+                f"Priority: {priority}",
+                f"Tags:     {tags_str if tags_str else 'None'}",
+                f"Query:    {query}",
+                f"Message:  {message_truncated}",
+            ]
+            if monitor.get("_stale"):
+                rows.append("\nNote: Datadog is unavailable, showing cached monitor data")
+
+            content = _HEADER + "\n".join(rows) + "\n"
+
+        result = text_result(content)
+        if not monitor.get("_stale"):
+            _remember_result(key, monitor, result)
+        return result
 
     except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Monitor not found")],
-                isError=True,
-            )
-        elif e.response.status_code == 403:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Permission denied")],
-                isError=True,
-            )
-        logger.error(f"Error in get_monitor: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-        )
+        result = HTTP_ERROR_RESULTS.get(e.response.status_code)
+        if result is not None:
+            return result
+        logger.error("Error in get_monitor: %s", e)
+        return error_result(f"Error: {e}")
+    except httpx.TimeoutException as e:
+        logger.error("Timeout in get_monitor: %s", e)
+        return TIMEOUT_RESULT
     except Exception as e:
-        logger.error(f"Error in get_monitor: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-        )
+        logger.error("Error in get_monitor: %s", e)
+        return error_result(f"Error: {e}")
@@ -4,54 +4,73 @@ Monitor edit tool
 
 import logging
 
-from mcp.types import CallToolRequest, CallToolResult, Tool, TextContent
+from mcp.types import CallToolRequest, CallToolResult, Tool
 import httpx
 
 logger = logging.getLogger(__name__)
 
 from ..utils.datadog_client import update_monitor
+from ._common import (
+    HTTP_ERROR_RESULTS,
+    TIMEOUT_RESULT,
+    compile_validator,
+    error_result,
+    text_result,
+)
+from ._schemas import MONITOR_ID_SCHEMA
+
+# Monitor fields this tool can change, forwarded to update_monitor when set
+_UPDATE_FIELDS = ("name", "message", "tags", "priority", "query")
+
+_NO_UPDATES_RESULT = error_result("At least one field to update is required")
+
+
+_TOOL_DEFINITION = Tool(
+    name="monitor_edit",
+    description="Update basic fields of an existing Datadog monitor. At least one update field must be provided.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "monitor_id": {
+                **MONITOR_ID_SCHEMA,
+                "description": "The numeric ID of the monitor to update.",
+            },
+            "name": {
+                "type": "string",
+                "description": "New name for the monitor.",
+            },
+            "message": {
+                "type": "string",
+                "description": "New message/description for the monitor.",
+            },
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "New list of tags for the monitor.",
+            },
+            "priority": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 5,
+                "description": "New priority level (1-5) for the monitor.",
+            },
+            "query": {
+                "type": "string",
+                "description": "New query for the monitor.",
+            },
+        },
+        "additionalProperties": False,
+        "required": ["monitor_id"],
+    },
+)
+
+
+_VALIDATE = compile_validator(_TOOL_DEFINITION.inputSchema)
 
 
 def get_tool_definition() -> Tool:
     """Get the tool definition for monitor_edit."""
-    return Tool(
-        name="monitor_edit",
-        description="Update basic fields of an existing Datadog monitor. At least one update field must be provided.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "monitor_id": {
-                    "type": "integer",
-                    "description": "The numeric ID of the monitor to update.",
-                },
-                "name": {
-                    "type": "string",
-                    "description": "New name for the monitor.",
-                },
-                "message": {
-                    "type": "string",
-                    "description": "New message/description for the monitor.",
-                },
-                "tags": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "New list of tags for the monitor.",
-                },
-                "priority": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 5,
-                    "description": "New priority level (1-5) for the monitor.",
-                },
-                "query": {
-                    "type": "string",
-                    "description": "New query for the monitor.",
-                },
-            },
-            "additionalProperties": False,
-            "required": ["monitor_id"],
-        },
-    )
+    return _TOOL_DEFINITION
 
 
 async def handle_call(request: CallToolRequest) -> CallToolResult:
@@ -59,70 +78,30 @@ async def handle_call(request: CallToolRequest) -> CallToolResult:
     try:
         args = request.arguments or {}
 
-        monitor_id = args.get("monitor_id")
-
-        if monitor_id is None:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: monitor_id is required")],
-                isError=True,
-            )
-
-        name = args.get("name")
-        message = args.get("message")
-        tags = args.get("tags")
-        priority = args.get("priority")
-        query = args.get("query")
-
-        if priority is not None and (priority < 1 or priority > 5):
-            return CallToolResult(
-                content=[TextContent(type="text", text="Invalid priority: must be 1-5")],
-                isError=True,
-            )
-
-        updates = {}
-        if name is not None:
-            updates["name"] = name
-        if message is not None:
-            updates["message"] = message
-        if tags is not None:
-            updates["tags"] = tags
-        if priority is not None:
-            updates["priority"] = priority
-        if query is not None:
-            updates["query"] = query
+        invalid = _VALIDATE(args)
+        if invalid is not None:
+            return invalid
+
+        monitor_id = args["monitor_id"]
+
+        updates = {field: args[field] for field in _UPDATE_FIELDS if args.get(field) is not None}
 
         if not updates:
-            return CallToolResult(
-                content=[TextContent(type="text", text="At least one field to update is required")],
-                isError=True,
-            )
+            return _NO_UPDATES_RESULT
 
         await update_monitor(monitor_id, **updates)
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Monitor {monitor_id} updated successfully")],
-            isError=False,
-        )
+        return text_result(f"Monitor {monitor_id} updated successfully")
 
     except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Monitor not found")],
-                isError=True,
-            )
-        elif e.response.status_code == 403:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Permission denied")],
-                isError=True,
-            )
-        logger.error(f"Error in monitor_edit: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-        )
+        result = HTTP_ERROR_RESULTS.get(e.response.status_code)
+        if result is not None:
+            return result
+        logger.error("Error in monitor_edit: %s", e)
+        return error_result(f"Error: {e}")
+    except httpx.TimeoutException as e:
+        logger.error("Timeout in monitor_edit: %s", e)
+        return TIMEOUT_RESULT
     except Exception as e:
-        logger.error(f"Error in monitor_edit: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-        )
+        logger.error("Error in monitor_edit: %s", e)
+        return error_result(f"Error: {e}")
@@ -2,10 +2,12 @@
 Datadog API client utilities
 """
 
+import asyncio
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import httpx
 from datadog_api_client import ApiClient, Configuration
@@ -22,6 +24,9 @@ from datadog_api_client.v2.model.logs_compute_type import LogsComputeType
 from datadog_api_client.v2.model.logs_group_by import LogsGroupBy
 from datadog_api_client.v2.model.logs_aggregate_sort import LogsAggregateSort
 
+from .http import build_timeout, get_client
+from .monitor_cache import monitor_cache
+
 logger = logging.getLogger(__name__)
 
 # Default Datadog site (US1) - used as fallback when DD_SITE is not set
@@ -79,6 +84,18 @@ if not DATADOG_API_KEY or not DATADOG_APP_KEY:
     logger.error("DD_API_KEY and DD_APP_KEY environment variables must be set")
     raise ValueError("Datadog API credentials not configured")
 
+# Monitor PUTs carry the full monitor body, so allow a longer write phase
+MONITOR_UPDATE_TIMEOUT = build_timeout(write=8.0)
+
+# Batch concurrent monitor fetches into one list request. Off by default
+# since every fetch then waits out the batching window.
+MONITOR_BATCHING_ENABLED = os.getenv("DD_MONITOR_BATCHING", "").lower() in ("1", "true", "yes")
+MONITOR_BATCH_WINDOW = 0.005
+MONITOR_BATCH_MAX_PAGE_SIZE = 1000
+# Monitor IDs are sparse, so only list a range spanning at most this many
+# IDs per requested monitor; wider batches are fetched individually
+MONITOR_BATCH_MAX_SPAN_RATIO = 4
+
 
 def get_datadog_configuration() -> Configuration:
     """Get Datadog API configuration."""
@@ -859,34 +876,178 @@ async def update_dashboard_title(
             raise
 
 
+async def _request_monitor(monitor_id: int) -> Dict[str, Any]:
+    """GET a single monitor from Datadog, bypassing the monitor cache."""
+    try:
+        response = await get_client().get(f"/api/v1/monitor/{monitor_id}")
+        response.raise_for_status()
+        return response.json()
+
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error fetching monitor '{monitor_id}': {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching monitor '{monitor_id}': {e}")
+        raise
+
+
+async def _request_monitor_range(monitor_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """List monitors covering the sorted IDs in one request, keyed by ID.
+
+    Monitors in the range that were not asked for are dropped, and IDs
+    beyond the page size are simply missing from the result.
+    """
+    params = {
+        "id_offset": monitor_ids[0] - 1,
+        "page": 0,
+        "page_size": min(monitor_ids[-1] - monitor_ids[0] + 1, MONITOR_BATCH_MAX_PAGE_SIZE),
+    }
+
+    try:
+        response = await get_client().get("/api/v1/monitor", params=params)
+        response.raise_for_status()
+        wanted = set(monitor_ids)
+        return {m["id"]: m for m in response.json() if m.get("id") in wanted}
+
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error listing monitors {monitor_ids}: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Error listing monitors {monitor_ids}: {e}")
+        raise
+
+
+class _MonitorBatcher:
+    """Collects monitor fetches over a short window and resolves them together.
+
+    Monitors missing from the batched list response, or all of them if the
+    list request fails or their IDs are too far apart, are fetched
+    individually.
+    """
+
+    def __init__(self, window: float = MONITOR_BATCH_WINDOW):
+        self.window = window
+        self.pending: List[Tuple[int, "asyncio.Future[Dict[str, Any]]"]] = []
+        self.task: Optional["asyncio.Task[None]"] = None
+        # The event loop only holds weak references to tasks, so keep
+        # flushes alive here until they finish
+        self.flushing: Set["asyncio.Task[None]"] = set()
+
+    async def fetch(self, monitor_id: int) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((monitor_id, future))
+        if self.task is None:
+            self.task = asyncio.create_task(self._flush())
+            self.flushing.add(self.task)
+            self.task.add_done_callback(self.flushing.discard)
+        return await future
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self.window)
+        batch, self.pending, self.task = self.pending, [], None
+
+        monitor_ids = sorted({monitor_id for monitor_id, _ in batch})
+        found: Dict[int, Dict[str, Any]] = {}
+        span = monitor_ids[-1] - monitor_ids[0] + 1
+        if 1 < len(monitor_ids) and span <= len(monitor_ids) * MONITOR_BATCH_MAX_SPAN_RATIO:
+            try:
+                found = await _request_monitor_range(monitor_ids)
+            except Exception as e:
+                logger.warning(f"Batched monitor fetch failed, fetching individually: {e}")
+
+        missing = [monitor_id for monitor_id in monitor_ids if monitor_id not in found]
+        results = await asyncio.gather(
+            *(_request_monitor(monitor_id) for monitor_id in missing),
+            return_exceptions=True,
+        )
+        found.update(zip(missing, results))
+
+        for monitor_id, future in batch:
+            if future.done():
+                continue
+            result = found[monitor_id]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_monitor_batcher = _MonitorBatcher()
+
+
+# Tasks for monitor fetches currently in flight, keyed by monitor ID
+_inflight_monitors: Dict[int, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _forget_inflight(monitor_id: int, task: "asyncio.Task[Dict[str, Any]]") -> None:
+    """Drop a finished fetch unless an invalidation already replaced it."""
+    if _inflight_monitors.get(monitor_id) is task:
+        del _inflight_monitors[monitor_id]
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether an HTTP error is a server-side or transport failure."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _invalidate_monitor(monitor_id: int) -> None:
+    """Drop a monitor from the cache and detach any fetch already in flight."""
+    monitor_cache.invalidate(monitor_id)
+    _inflight_monitors.pop(monitor_id, None)
+
+
+async def _load_monitor(monitor_id: int) -> Dict[str, Any]:
+    """Fetch a monitor into the cache, falling back to a stale copy on outages.
+
+    The result is not cached if the monitor was invalidated mid-fetch, since
+    it may predate the edit.
+    """
+    generation = monitor_cache.generation(monitor_id)
+    try:
+        if MONITOR_BATCHING_ENABLED:
+            monitor = await _monitor_batcher.fetch(monitor_id)
+        else:
+            monitor = await _request_monitor(monitor_id)
+    except httpx.HTTPError as e:
+        stale = monitor_cache.get_stale(monitor_id)
+        if stale is None or not _is_transient_error(e):
+            raise
+        logger.warning(f"Serving cached monitor '{monitor_id}' after error: {e}")
+        return {**stale, "_stale": True}
+
+    if monitor_cache.generation(monitor_id) == generation:
+        monitor_cache.set(monitor_id, monitor)
+    return monitor
+
+
 async def fetch_monitor(monitor_id: int) -> Dict[str, Any]:
     """Fetch a single monitor by ID from Datadog.
 
+    Results are cached for a short TTL. If Datadog fails with a 5xx or
+    transport error and an expired copy is cached, that copy is returned
+    with a ``_stale`` marker instead of raising. Concurrent calls for the
+    same monitor share a single in-flight request; cancelling one caller
+    only stops it waiting, the request still completes for the others.
+
     Args:
         monitor_id: The numeric ID of the monitor to fetch
 
     Returns:
         Dict containing the full monitor object
     """
-    url = f"{DATADOG_API_URL}/api/v1/monitor/{monitor_id}"
-
-    headers = {
-        "DD-API-KEY": DATADOG_API_KEY,
-        "DD-APPLICATION-KEY": DATADOG_APP_KEY,
-    }
+    cached = monitor_cache.get(monitor_id)
+    if cached is not None:
+        return cached
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.json()
+    task = _inflight_monitors.get(monitor_id)
+    if task is None:
+        task = asyncio.ensure_future(_load_monitor(monitor_id))
+        _inflight_monitors[monitor_id] = task
+        task.add_done_callback(partial(_forget_inflight, monitor_id))
 
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error fetching monitor '{monitor_id}': {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error fetching monitor '{monitor_id}': {e}")
-            raise
+    return await asyncio.shield(task)
 
 
 async def update_monitor(monitor_id: int, **updates) -> Dict[str, Any]:
@@ -906,30 +1067,27 @@ async def update_monitor(monitor_id: int, **updates) -> Dict[str, Any]:
     Returns:
         Dict containing the updated monitor data
     """
-    monitor = await fetch_monitor(monitor_id)
+    # Always start from the live monitor so the PUT never reverts other edits
+    monitor = await _request_monitor(monitor_id)
 
     allowed_fields = {"name", "message", "tags", "priority", "query"}
     for field, value in updates.items():
         if field in allowed_fields:
             monitor[field] = value
 
-    url = f"{DATADOG_API_URL}/api/v1/monitor/{monitor_id}"
-
-    headers = {
-        "Content-Type": "application/json",
-        "DD-API-KEY": DATADOG_API_KEY,
-        "DD-APPLICATION-KEY": DATADOG_APP_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.put(url, headers=headers, json=monitor)
-            response.raise_for_status()
-            return response.json()
+    try:
+        response = await get_client().put(
+            f"/api/v1/monitor/{monitor_id}",
+            json=monitor,
+            timeout=MONITOR_UPDATE_TIMEOUT,
+        )
+        response.raise_for_status()
+        _invalidate_monitor(monitor_id)
+        return response.json()
 
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error updating monitor '{monitor_id}': {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error updating monitor '{monitor_id}': {e}")
-            raise
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error updating monitor '{monitor_id}': {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Error updating monitor '{monitor_id}': {e}")
+        raise
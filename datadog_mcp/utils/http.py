@@ -0,0 +1,73 @@
+"""
+Shared httpx client for Datadog API calls
+"""
+
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive pool shared across tool calls so each request reuses an open
+# TCP/TLS connection instead of paying a fresh handshake.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Per-phase timeouts in seconds. A short connect timeout fails fast on dead
+# endpoints; pool waits are unbounded so bursts queue instead of erroring.
+HTTP_TIMEOUTS: Dict[str, float] = {
+    "connect": 3.0,
+    "read": 10.0,
+    "write": 5.0,
+}
+
+
+def build_timeout(**overrides: float) -> httpx.Timeout:
+    """Build an httpx.Timeout from HTTP_TIMEOUTS with per-endpoint overrides.
+
+    Args:
+        **overrides: Phase timeouts (connect, read, write) to override
+
+    Returns:
+        An httpx.Timeout with no pool timeout
+    """
+    return httpx.Timeout(**{**HTTP_TIMEOUTS, **overrides}, pool=None)
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared Datadog API client, creating it on first use.
+
+    Returns:
+        An httpx.AsyncClient configured with the Datadog base URL and
+        authentication headers.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        # Imported lazily so the client picks up the current DD_SITE/credentials
+        from .datadog_client import DATADOG_API_URL, DATADOG_API_KEY, DATADOG_APP_KEY
+
+        _client = httpx.AsyncClient(
+            base_url=DATADOG_API_URL,
+            headers={
+                "DD-API-KEY": DATADOG_API_KEY,
+                "DD-APPLICATION-KEY": DATADOG_APP_KEY,
+            },
+            limits=HTTP_LIMITS,
+            timeout=build_timeout(),
+        )
+
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared Datadog API client, if one was created."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Closed shared Datadog HTTP client")
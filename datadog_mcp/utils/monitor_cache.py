@@ -0,0 +1,94 @@
+"""
+In-process TTL cache for monitor lookups
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Monitor metadata rarely changes second-to-second, so repeat get_monitor
+# calls within the TTL are served without a Datadog round trip.
+MONITOR_CACHE_MAXSIZE = 1024
+MONITOR_CACHE_TTL = 15.0
+
+# Monitors sitting in OK rarely change, while alerting ones may flip often,
+# so the TTL follows overall_state. Unlisted states use MONITOR_CACHE_TTL.
+MONITOR_CACHE_TTL_BY_STATE: Dict[str, float] = {
+    "OK": 60.0,
+    "Warn": 15.0,
+    "No Data": 15.0,
+    "Alert": 5.0,
+}
+
+# Above this fill ratio TTLs are halved so entries expire and free up sooner
+MONITOR_CACHE_PRESSURE_RATIO = 0.9
+
+
+class MonitorCache:
+    """Bounded LRU cache of monitor objects with a per-entry deadline.
+
+    Expired entries are kept until evicted so they can be served as a
+    stale fallback when Datadog is unavailable.
+    """
+
+    def __init__(self, maxsize: int = MONITOR_CACHE_MAXSIZE, ttl: float = MONITOR_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Bumped on every invalidation so fetches started earlier can tell
+        # their result is outdated
+        self._generations: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, monitor_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached monitor if it has not expired."""
+        entry = self._entries.get(monitor_id)
+        if entry is None:
+            return None
+
+        deadline, monitor = entry
+        if time.monotonic() >= deadline:
+            return None
+
+        self._entries.move_to_end(monitor_id)
+        return monitor
+
+    def get_stale(self, monitor_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached monitor regardless of expiry."""
+        entry = self._entries.get(monitor_id)
+        return entry[1] if entry is not None else None
+
+    def ttl_for(self, monitor: Dict[str, Any]) -> float:
+        """Get the TTL for a monitor based on its state and cache pressure."""
+        ttl = MONITOR_CACHE_TTL_BY_STATE.get(monitor.get("overall_state"), self.ttl)
+        if len(self._entries) > self.maxsize * MONITOR_CACHE_PRESSURE_RATIO:
+            ttl *= 0.5
+        return ttl
+
+    def set(self, monitor_id: int, monitor: Dict[str, Any]) -> None:
+        """Store a freshly fetched monitor, evicting the least recently used."""
+        self._entries[monitor_id] = (time.monotonic() + self.ttl_for(monitor), monitor)
+        self._entries.move_to_end(monitor_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def generation(self, monitor_id: int) -> int:
+        """Get the number of times a monitor has been invalidated."""
+        return self._generations.get(monitor_id, 0)
+
+    def invalidate(self, monitor_id: int) -> None:
+        """Drop a monitor so the next lookup refetches it."""
+        self._entries.pop(monitor_id, None)
+        self._generations[monitor_id] = self.generation(monitor_id) + 1
+
+    def clear(self) -> None:
+        """Drop all cached monitors."""
+        self._entries.clear()
+
+
+monitor_cache = MonitorCache()
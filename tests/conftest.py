@@ -4,8 +4,12 @@ Pytest configuration and shared fixtures
 
 import pytest
 import os
+import httpx
 from unittest.mock import patch, MagicMock, AsyncMock
 
+from datadog_mcp.utils import http
+from datadog_mcp.utils.monitor_cache import monitor_cache
+
 
 @pytest.fixture
 def mock_env_credentials():
@@ -29,6 +33,30 @@ def mock_httpx_client():
         yield mock_client
 
 
+@pytest.fixture(autouse=True)
+def clear_monitor_cache():
+    """Keep cached monitors from leaking between tests"""
+    monitor_cache.clear()
+    yield
+    monitor_cache.clear()
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route the shared Datadog httpx client through an httpx.MockTransport.
+
+    Returns a function that takes a request handler and installs it.
+    """
+    def _install(handler):
+        client = httpx.AsyncClient(
+            base_url="https://api.datadoghq.com",
+            transport=httpx.MockTransport(handler),
+        )
+        monkeypatch.setattr(http, "_client", client)
+        return client
+    return _install
+
+
 @pytest.fixture
 def sample_request():
     """Create a sample request object"""
@@ -2,12 +2,15 @@
 Tests for get_monitor tool functionality
 """
 
+import asyncio
+import sys
 import pytest
 import json
 from unittest.mock import patch, AsyncMock, MagicMock
 import httpx
 from datadog_mcp.tools import get_monitor
 from datadog_mcp.utils import datadog_client
+from datadog_mcp.utils.monitor_cache import MonitorCache, monitor_cache
 from mcp.types import CallToolResult, TextContent
 
 
@@ -55,12 +58,28 @@ class TestGetMonitorToolDefinition:
         monitor_id_prop = schema["properties"]["monitor_id"]
         assert monitor_id_prop["type"] == "integer"
 
+    def test_get_monitor_tool_definition_is_shared(self):
+        """Test the tool definition is built once and reused"""
+        assert get_monitor.get_tool_definition() is get_monitor.get_tool_definition()
+
+    def test_monitor_id_schema_shared_across_tools(self):
+        """Test both monitor tools share monitor_id constraints with their own descriptions"""
+        from datadog_mcp.tools import monitor_edit
+
+        get_id = get_monitor.get_tool_definition().inputSchema["properties"]["monitor_id"]
+        edit_id = monitor_edit.get_tool_definition().inputSchema["properties"]["monitor_id"]
+
+        assert get_id["type"] == edit_id["type"] == "integer"
+        assert get_id["minimum"] == edit_id["minimum"] == 1
+        assert "fetch" in get_id["description"]
+        assert "update" in edit_id["description"]
+
 
 class TestGetMonitorRetrieval:
     """Test monitor data retrieval via fetch_monitor"""
 
     @pytest.mark.asyncio
-    async def test_fetch_monitor_basic(self):
+    async def test_fetch_monitor_basic(self, mock_transport):
         """Test basic monitor fetching"""
         mock_response_data = {
             "id": 12345,
@@ -73,25 +92,18 @@ class TestGetMonitorRetrieval:
             "tags": ["env:prod", "team:backend"],
         }
 
-        with patch("datadog_mcp.utils.datadog_client.httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_transport(lambda request: httpx.Response(200, json=mock_response_data))
 
-            result = await datadog_client.fetch_monitor(12345)
+        result = await datadog_client.fetch_monitor(12345)
 
-            assert isinstance(result, dict)
-            assert result["id"] == 12345
-            assert result["name"] == "CPU High Alert"
-            assert result["type"] == "metric alert"
-            assert result["overall_state"] == "OK"
+        assert isinstance(result, dict)
+        assert result["id"] == 12345
+        assert result["name"] == "CPU High Alert"
+        assert result["type"] == "metric alert"
+        assert result["overall_state"] == "OK"
 
     @pytest.mark.asyncio
-    async def test_fetch_monitor_with_all_fields(self):
+    async def test_fetch_monitor_with_all_fields(self, mock_transport):
         """Test monitor fetching returns all expected fields"""
         mock_response_data = {
             "id": 99999,
@@ -106,44 +118,394 @@ class TestGetMonitorRetrieval:
             "modified": "2024-01-15T12:00:00Z",
         }
 
-        with patch("datadog_mcp.utils.datadog_client.httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status = MagicMock()
+        mock_transport(lambda request: httpx.Response(200, json=mock_response_data))
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        result = await datadog_client.fetch_monitor(99999)
+
+        assert result["id"] == 99999
+        assert result["priority"] == 1
+        assert result["query"] == "avg(last_5m):avg:system.mem.used{*} > 80"
+        assert len(result["tags"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_monitor_uses_shared_client(self, mock_transport):
+        """Test fetch_monitor requests the monitor endpoint on the shared client"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": 12345})
+
+        mock_transport(handler)
 
-            result = await datadog_client.fetch_monitor(99999)
+        await datadog_client.fetch_monitor(12345)
+        await datadog_client.fetch_monitor(67890)
 
-            assert result["id"] == 99999
-            assert result["priority"] == 1
-            assert result["query"] == "avg(last_5m):avg:system.mem.used{*} > 80"
-            assert len(result["tags"]) == 3
+        assert [r.url.path for r in requests] == [
+            "/api/v1/monitor/12345",
+            "/api/v1/monitor/67890",
+        ]
+        assert all(r.method == "GET" for r in requests)
 
     @pytest.mark.asyncio
-    async def test_fetch_monitor_api_error(self):
+    async def test_fetch_monitor_api_error(self, mock_transport):
         """Test fetch_monitor handles API errors"""
-        with patch("datadog_mcp.utils.datadog_client.httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "Not Found",
-                request=MagicMock(),
-                response=MagicMock(status_code=404),
-            )
+        mock_transport(lambda request: httpx.Response(404, json={"errors": ["Not Found"]}))
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        with pytest.raises(httpx.HTTPStatusError):
+            await datadog_client.fetch_monitor(99999999)
+
+
+class TestGetMonitorCache:
+    """Test caching of fetch_monitor results"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_monitor_serves_repeat_calls_from_cache(self, mock_transport):
+        """Test repeat fetches within the TTL make a single request"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": 12345, "name": "CPU High Alert"})
+
+        mock_transport(handler)
+
+        first = await datadog_client.fetch_monitor(12345)
+        second = await datadog_client.fetch_monitor(12345)
+
+        assert first == second
+        assert len(requests) == 1
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await datadog_client.fetch_monitor(99999999)
+    @pytest.mark.asyncio
+    async def test_fetch_monitor_refetches_after_ttl(self, mock_transport, monkeypatch):
+        """Test expired entries are fetched again"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": 12345})
+
+        mock_transport(handler)
+        monkeypatch.setattr(monitor_cache, "ttl", 0)
+
+        await datadog_client.fetch_monitor(12345)
+        await datadog_client.fetch_monitor(12345)
+
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_monitor_serves_stale_on_server_error(self, mock_transport, monkeypatch):
+        """Test an expired entry is returned when Datadog fails with 5xx"""
+        responses = iter([
+            httpx.Response(200, json={"id": 12345, "name": "CPU High Alert"}),
+            httpx.Response(503),
+        ])
+        mock_transport(lambda request: next(responses))
+        monkeypatch.setattr(monitor_cache, "ttl", 0)
+
+        await datadog_client.fetch_monitor(12345)
+        result = await datadog_client.fetch_monitor(12345)
+
+        assert result["name"] == "CPU High Alert"
+        assert result["_stale"] is True
+        assert "_stale" not in monitor_cache.get_stale(12345)
+
+    @pytest.mark.asyncio
+    async def test_fetch_monitor_does_not_serve_stale_on_not_found(self, mock_transport, monkeypatch):
+        """Test client errors are raised even when a cached copy exists"""
+        responses = iter([
+            httpx.Response(200, json={"id": 12345}),
+            httpx.Response(404),
+        ])
+        mock_transport(lambda request: next(responses))
+        monkeypatch.setattr(monitor_cache, "ttl", 0)
+
+        await datadog_client.fetch_monitor(12345)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await datadog_client.fetch_monitor(12345)
+
+    def test_cache_ttl_follows_overall_state(self):
+        """Test monitors in quieter states are cached longer"""
+        cache = MonitorCache(maxsize=100, ttl=15)
+
+        assert cache.ttl_for({"overall_state": "OK"}) == 60
+        assert cache.ttl_for({"overall_state": "Warn"}) == 15
+        assert cache.ttl_for({"overall_state": "Alert"}) == 5
+        assert cache.ttl_for({"overall_state": "Skipped"}) == 15
+        assert cache.ttl_for({}) == 15
+
+    def test_cache_ttl_halves_under_pressure(self):
+        """Test TTLs shrink once the cache is over 90% full"""
+        cache = MonitorCache(maxsize=10, ttl=15)
+        for monitor_id in range(10):
+            cache.set(monitor_id, {"id": monitor_id})
+
+        assert cache.ttl_for({"overall_state": "OK"}) == 30
+
+    @pytest.mark.asyncio
+    async def test_update_monitor_invalidates_cache(self, mock_transport):
+        """Test a successful update drops the cached monitor"""
+        def handler(request):
+            if request.method == "PUT":
+                return httpx.Response(200, content=request.content)
+            return httpx.Response(200, json={"id": 12345, "name": "Old Name"})
+
+        mock_transport(handler)
+
+        await datadog_client.fetch_monitor(12345)
+        await datadog_client.update_monitor(12345, name="New Name")
+
+        assert monitor_cache.get(12345) is None
+
+    @pytest.mark.asyncio
+    async def test_update_monitor_discards_inflight_fetch(self, mock_transport):
+        """Test a fetch started before an update does not cache pre-edit data"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(request):
+            if request.method == "PUT":
+                return httpx.Response(200, content=request.content)
+            if not started.is_set():
+                started.set()
+                await release.wait()
+            return httpx.Response(200, json={"id": 12345, "name": "Old Name"})
+
+        mock_transport(handler)
+
+        stale_fetch = asyncio.create_task(datadog_client.fetch_monitor(12345))
+        await started.wait()
+        await datadog_client.update_monitor(12345, name="New Name")
+
+        assert 12345 not in datadog_client._inflight_monitors
+
+        release.set()
+        await stale_fetch
+
+        assert monitor_cache.get(12345) is None
+
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_marks_stale_data(self):
+        """Test the table output notes when cached data is served"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.return_value = {"id": 12345, "name": "Test Monitor", "_stale": True}
+
+            result = await get_monitor.handle_call(mock_request)
+
+            assert result.isError is False
+            assert "cached" in result.content[0].text
+
+
+class TestGetMonitorSingleFlight:
+    """Test coalescing of concurrent fetch_monitor calls"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_request(self, mock_transport):
+        """Test concurrent fetches for one monitor make a single request"""
+        requests = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            requests.append(request)
+            await release.wait()
+            return httpx.Response(200, json={"id": 12345, "name": "CPU High Alert"})
+
+        mock_transport(handler)
+
+        tasks = [asyncio.create_task(datadog_client.fetch_monitor(12345)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(requests) == 1
+        assert all(r["name"] == "CPU High Alert" for r in results)
+        assert datadog_client._inflight_monitors == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, mock_transport):
+        """Test cancelling the first caller leaves other waiters unaffected"""
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, json={"id": 12345, "name": "CPU High Alert"})
+
+        mock_transport(handler)
+
+        leader = asyncio.create_task(datadog_client.fetch_monitor(12345))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(datadog_client.fetch_monitor(12345))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await follower
+
+        assert leader.cancelled()
+        assert result["name"] == "CPU High Alert"
+        assert datadog_client._inflight_monitors == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_errors(self, mock_transport):
+        """Test every waiter sees the error from the shared request"""
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(404)
+
+        mock_transport(handler)
+
+        tasks = [asyncio.create_task(datadog_client.fetch_monitor(12345)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert datadog_client._inflight_monitors == {}
+
+
+class TestGetMonitorBatching:
+    """Test batching of concurrent fetch_monitor calls into one list request"""
+
+    @pytest.fixture(autouse=True)
+    def enable_batching(self, monkeypatch):
+        monkeypatch.setattr(datadog_client, "MONITOR_BATCHING_ENABLED", True)
+        monkeypatch.setattr(datadog_client, "_monitor_batcher", datadog_client._MonitorBatcher())
+
+    @pytest.mark.asyncio
+    async def test_batched_fetches_use_one_list_request(self, mock_transport):
+        """Test concurrent fetches for different monitors share a list request"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[
+                {"id": 12345, "name": "CPU"},
+                {"id": 12346, "name": "Unrequested"},
+                {"id": 12347, "name": "Memory"},
+            ])
+
+        mock_transport(handler)
+
+        cpu, memory = await asyncio.gather(
+            datadog_client.fetch_monitor(12345),
+            datadog_client.fetch_monitor(12347),
+        )
+
+        assert cpu["name"] == "CPU"
+        assert memory["name"] == "Memory"
+        assert len(requests) == 1
+        assert requests[0].url.path == "/api/v1/monitor"
+        assert requests[0].url.params["id_offset"] == "12344"
+        assert requests[0].url.params["page_size"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_batched_fetch_falls_back_for_missing_monitors(self, mock_transport):
+        """Test monitors missing from the list response are fetched individually"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == "/api/v1/monitor":
+                return httpx.Response(200, json=[{"id": 12345, "name": "CPU"}])
+            return httpx.Response(200, json={"id": 12347, "name": "Memory"})
+
+        mock_transport(handler)
+
+        cpu, memory = await asyncio.gather(
+            datadog_client.fetch_monitor(12345),
+            datadog_client.fetch_monitor(12347),
+        )
+
+        assert cpu["name"] == "CPU"
+        assert memory["name"] == "Memory"
+        assert paths == ["/api/v1/monitor", "/api/v1/monitor/12347"]
+
+    @pytest.mark.asyncio
+    async def test_batched_fetch_skips_list_for_sparse_ids(self, mock_transport):
+        """Test monitors with far-apart IDs are fetched individually"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            monitor_id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"id": monitor_id})
+
+        mock_transport(handler)
+
+        await asyncio.gather(
+            datadog_client.fetch_monitor(12345),
+            datadog_client.fetch_monitor(99999),
+        )
+
+        assert sorted(paths) == ["/api/v1/monitor/12345", "/api/v1/monitor/99999"]
+
+    @pytest.mark.asyncio
+    async def test_batcher_keeps_flush_task_referenced(self, mock_transport):
+        """Test a running flush is strongly referenced until it finishes"""
+        mock_transport(lambda request: httpx.Response(200, json={"id": 12345}))
+        batcher = datadog_client._monitor_batcher
+
+        fetch = asyncio.create_task(datadog_client.fetch_monitor(12345))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert len(batcher.flushing) == 1
+        await fetch
+        await asyncio.sleep(0)
+        assert batcher.flushing == set()
+
+    @pytest.mark.asyncio
+    async def test_batched_fetch_falls_back_when_list_fails(self, mock_transport):
+        """Test a failed list request falls back to per-monitor requests"""
+        def handler(request):
+            if request.url.path == "/api/v1/monitor":
+                return httpx.Response(500)
+            if request.url.path == "/api/v1/monitor/12347":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"id": 12345, "name": "CPU"})
+
+        mock_transport(handler)
+
+        cpu, missing = await asyncio.gather(
+            datadog_client.fetch_monitor(12345),
+            datadog_client.fetch_monitor(12347),
+            return_exceptions=True,
+        )
+
+        assert cpu["name"] == "CPU"
+        assert isinstance(missing, httpx.HTTPStatusError)
 
 
 class TestGetMonitorHandlers:
     """Test get_monitor tool handlers"""
 
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_null_format(self):
+        """Test a null format is treated as omitted and renders a table"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345, "format": None}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.return_value = {"id": 12345, "name": "CPU High Alert"}
+
+            result = await get_monitor.handle_call(mock_request)
+
+            assert result.isError is False
+            assert "Monitor Details" in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_handle_get_monitor_success_table(self):
         """Test successful monitor retrieval with table format"""
@@ -213,6 +575,63 @@ class TestGetMonitorHandlers:
             assert parsed["id"] == 12345
             assert parsed["name"] == "Test Monitor"
 
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_json_without_orjson(self, monkeypatch):
+        """Test JSON format falls back to the stdlib encoder without orjson"""
+        monkeypatch.setattr(get_monitor, "_dumps", None)
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345, "format": "json"}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.return_value = {"id": 12345, "name": "Test Monitor", "tags": []}
+
+            result = await get_monitor.handle_call(mock_request)
+
+            assert result.isError is False
+            assert json.loads(result.content[0].text) == mock_fetch.return_value
+
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_reuses_rendered_result(self):
+        """Test repeat calls for the same cached monitor return the same result"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345, "format": "table"}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.return_value = {"id": 12345, "name": "Old Name"}
+            first = await get_monitor.handle_call(mock_request)
+            second = await get_monitor.handle_call(mock_request)
+
+            mock_fetch.return_value = {"id": 12345, "name": "New Name"}
+            third = await get_monitor.handle_call(mock_request)
+
+            assert first is second
+            assert third is not first
+            assert "New Name" in third.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_does_not_reuse_stale_result(self):
+        """Test results rendered from stale data are not reused"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345, "format": "table"}
+        stale_monitor = {"id": 12345, "name": "Test Monitor", "_stale": True}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.return_value = stale_monitor
+            first = await get_monitor.handle_call(mock_request)
+            second = await get_monitor.handle_call(mock_request)
+
+            assert first is not second
+
     @pytest.mark.asyncio
     async def test_handle_get_monitor_default_format(self):
         """Test monitor retrieval with default format (table)"""
@@ -254,6 +673,57 @@ class TestGetMonitorHandlers:
         assert result.isError is True
         assert "monitor_id" in result.content[0].text.lower()
 
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_fixed_errors_are_shared(self):
+        """Test fixed error results are reused rather than rebuilt per call"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 0}
+
+        first = await get_monitor.handle_call(mock_request)
+        second = await get_monitor.handle_call(mock_request)
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {"monitor_id": 12345, "format": "xml"},
+            {"monitor_id": 12345, "unknown": True},
+        ],
+    )
+    async def test_handle_get_monitor_schema_violation(self, arguments):
+        """Test arguments rejected by the input schema never reach Datadog"""
+        mock_request = MagicMock()
+        mock_request.arguments = arguments
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            result = await get_monitor.handle_call(mock_request)
+
+            assert result.isError is True
+            assert result.content[0].text.startswith("Invalid arguments:")
+            mock_fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("monitor_id", ["12345", 12345.0, 0, -1, True])
+    async def test_handle_get_monitor_invalid_monitor_id(self, monitor_id):
+        """Test non-positive-integer monitor IDs are rejected without an API call"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": monitor_id}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            result = await get_monitor.handle_call(mock_request)
+
+            assert result.isError is True
+            assert "monitor_id" in result.content[0].text
+            mock_fetch.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_get_monitor_none_arguments(self):
         """Test error when arguments is None"""
@@ -332,6 +802,24 @@ class TestGetMonitorHandlers:
             assert result.isError is True
             assert "permission denied" in result.content[0].text.lower()
 
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_timeout(self):
+        """Test handling of request timeouts"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.side_effect = httpx.ReadTimeout("timed out")
+
+            result = await get_monitor.handle_call(mock_request)
+
+            assert isinstance(result, CallToolResult)
+            assert result.isError is True
+            assert result.content[0].text == "Request timed out"
+
     @pytest.mark.asyncio
     async def test_handle_get_monitor_truncates_long_message(self):
         """Test that long messages are truncated in table format"""
@@ -363,6 +851,24 @@ class TestGetMonitorHandlers:
             assert result.isError is False
             assert "..." in result.content[0].text
 
+    @pytest.mark.asyncio
+    async def test_handle_get_monitor_flattens_message(self):
+        """Test multi-line messages are flattened and missing messages show None"""
+        mock_request = MagicMock()
+        mock_request.arguments = {"monitor_id": 12345, "format": "table"}
+
+        with patch(
+            "datadog_mcp.tools.get_monitor.fetch_monitor",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            mock_fetch.return_value = {"id": 12345, "message": "CPU high\n@slack-alerts"}
+            result = await get_monitor.handle_call(mock_request)
+            assert "Message:  CPU high @slack-alerts\n" in result.content[0].text
+
+            mock_fetch.return_value = {"id": 12345, "message": None}
+            result = await get_monitor.handle_call(mock_request)
+            assert "Message:  None\n" in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_handle_get_monitor_many_tags_truncated(self):
         """Test that many tags are truncated in table format"""
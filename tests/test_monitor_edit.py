@@ -2,375 +2,230 @@
 Tests for monitor_edit tool functionality
 """
 
+import asyncio
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 import httpx
 from datadog_mcp.tools import monitor_edit
 from datadog_mcp.utils import datadog_client
-from mcp.types import CallToolResult, TextContent
+from mcp.types import CallToolResult
+
+# Handlers are awaited directly and never leave tasks behind, so the async
+# tests share one event loop for the whole module
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+
+# Monitor returned by the mocked GET; tests derive variants with dict(...)
+# rather than mutating it
+_BASE_MONITOR = {
+    "id": 12345,
+    "name": "Old Name",
+    "type": "metric alert",
+    "overall_state": "OK",
+    "message": "Old message",
+    "tags": ["env:prod"],
+    "priority": 3,
+    "query": "avg(last_5m):avg:system.cpu.user{*} > 90",
+}
+
+
+_REQUEST = httpx.Request("PUT", "https://api.datadoghq.com/api/v1/monitor/12345")
+
+
+def _http_error(code):
+    """Build the HTTPStatusError update_monitor raises for a status code"""
+    return httpx.HTTPStatusError(
+        f"HTTP {code}",
+        request=_REQUEST,
+        response=httpx.Response(code, request=_REQUEST),
+    )
+
+
+# (path, expected) pairs checked against monitor_edit's inputSchema
+_SCHEMA_EXPECTATIONS = (
+    (("required",), ["monitor_id"]),
+    (("properties", "monitor_id", "type"), "integer"),
+    (("properties", "monitor_id", "minimum"), 1),
+    (("properties", "priority", "type"), "integer"),
+    (("properties", "priority", "minimum"), 1),
+    (("properties", "priority", "maximum"), 5),
+    (("properties", "tags", "type"), "array"),
+    (("properties", "tags", "items", "type"), "string"),
+    (("properties", "query", "type"), "string"),
+)
+
+
+def _dig(schema, path):
+    """Follow a tuple of keys into a nested schema"""
+    for key in path:
+        schema = schema[key]
+    return schema
+
+
+# (id, fields) for successful updates, run together in one test;
+# handle_call should forward the fields to update_monitor unchanged
+_SUCCESS_CASES = (
+    ("name", {"name": "New Monitor Name"}),
+    ("message", {"message": "New alert message"}),
+    ("tags", {"tags": ["env:prod", "team:backend"]}),
+    ("priority", {"priority": 1}),
+    ("multiple_fields", {
+        "name": "New Name",
+        "message": "New message",
+        "tags": ["env:staging"],
+        "priority": 2,
+    }),
+    ("query_only", {"query": "avg(last_5m):avg:system.cpu.user{*} > 95"}),
+    ("query_with_other_fields", {
+        "name": "Updated Monitor",
+        "query": "avg(last_10m):avg:system.memory.used{*} > 80",
+    }),
+)
+
+
+def _assert_updated(mock_update, **fields):
+    """Assert update_monitor was called once for monitor 12345 with fields"""
+    assert mock_update.call_count == 1
+    args, kwargs = mock_update.call_args
+    assert args == (12345,)
+    assert kwargs == fields
+
+
+@pytest.fixture(scope="session")
+def tool_def():
+    """The monitor_edit tool definition, built once for the session"""
+    return monitor_edit.get_tool_definition()
+
+
+@pytest.fixture(scope="session")
+def validate():
+    """monitor_edit's compiled argument check"""
+    return monitor_edit._VALIDATE
+
+
+@pytest.fixture
+def mock_update(monkeypatch):
+    """Replace monitor_edit's update_monitor with an AsyncMock returning a monitor"""
+    mock = AsyncMock(return_value={"id": 12345})
+    monkeypatch.setattr(monitor_edit, "update_monitor", mock)
+    return mock
 
 
 class TestMonitorEditToolDefinition:
     """Test monitor_edit tool definition"""
 
-    def test_monitor_edit_tool_definition(self):
+    def test_monitor_edit_tool_definition(self, tool_def):
         """Test monitor_edit tool definition"""
-        tool_def = monitor_edit.get_tool_definition()
-
         assert tool_def.name == "monitor_edit"
         assert "monitor" in tool_def.description.lower()
         assert "update" in tool_def.description.lower()
         assert hasattr(tool_def, "inputSchema")
 
-        schema = tool_def.inputSchema
-        assert "properties" in schema
-
-        properties = schema["properties"]
-        assert "monitor_id" in properties
-        assert "name" in properties
-        assert "message" in properties
-        assert "tags" in properties
-        assert "priority" in properties
-
-    def test_monitor_edit_required_fields(self):
-        """Test monitor_edit required fields"""
-        tool_def = monitor_edit.get_tool_definition()
+    def test_tool_definition_shape(self, tool_def):
+        """Test monitor_edit input schema properties and constraints"""
         schema = tool_def.inputSchema
 
-        assert "required" in schema
-        assert "monitor_id" in schema["required"]
-        assert len(schema["required"]) == 1
+        assert {"monitor_id", "name", "message", "tags", "priority", "query"} <= schema["properties"].keys()
+        assert "description" in schema["properties"]["query"]
+        for path, expected in _SCHEMA_EXPECTATIONS:
+            assert _dig(schema, path) == expected, path
 
-    def test_monitor_edit_monitor_id_type(self):
-        """Test monitor_id is integer type"""
-        tool_def = monitor_edit.get_tool_definition()
-        schema = tool_def.inputSchema
+    def test_monitor_edit_tool_definition_is_shared(self):
+        """Test the tool definition is built once and reused"""
+        assert monitor_edit.get_tool_definition() is monitor_edit.get_tool_definition()
 
-        monitor_id_prop = schema["properties"]["monitor_id"]
-        assert monitor_id_prop["type"] == "integer"
-
-    def test_monitor_edit_priority_constraints(self):
-        """Test priority has valid constraints"""
-        tool_def = monitor_edit.get_tool_definition()
-        schema = tool_def.inputSchema
 
-        priority_prop = schema["properties"]["priority"]
-        assert priority_prop["type"] == "integer"
-        assert priority_prop["minimum"] == 1
-        assert priority_prop["maximum"] == 5
-
-    def test_monitor_edit_tags_array_type(self):
-        """Test tags is array of strings"""
-        tool_def = monitor_edit.get_tool_definition()
-        schema = tool_def.inputSchema
-
-        tags_prop = schema["properties"]["tags"]
-        assert tags_prop["type"] == "array"
-        assert tags_prop["items"]["type"] == "string"
+@module_loop
+class TestMonitorEditRetrieval:
+    """Test monitor update via update_monitor client function"""
 
-    def test_monitor_edit_query_property(self):
-        """Test query property exists with correct type and description"""
-        tool_def = monitor_edit.get_tool_definition()
-        schema = tool_def.inputSchema
+    async def test_update_monitor_basic(self, mock_transport):
+        """Test basic monitor update"""
+        def handler(request):
+            if request.method == "PUT":
+                return httpx.Response(200, json=dict(_BASE_MONITOR, name="New Name"))
+            return httpx.Response(200, json=_BASE_MONITOR)
 
-        assert "query" in schema["properties"]
-        query_prop = schema["properties"]["query"]
-        assert query_prop["type"] == "string"
-        assert "description" in query_prop
-        assert "query" not in schema.get("required", [])
+        mock_transport(handler)
 
+        result = await datadog_client.update_monitor(12345, name="New Name")
 
-class TestMonitorEditRetrieval:
-    """Test monitor update via update_monitor client function"""
+        assert isinstance(result, dict)
+        assert result["name"] == "New Name"
 
-    @pytest.mark.asyncio
-    async def test_update_monitor_basic(self):
-        """Test basic monitor update"""
-        mock_get_response = {
-            "id": 12345,
-            "name": "Old Name",
-            "type": "metric alert",
-            "overall_state": "OK",
-            "message": "Old message",
-            "tags": ["env:prod"],
-            "priority": 3,
-            "query": "avg(last_5m):avg:system.cpu.user{*} > 90",
-        }
-
-        mock_put_response = {
-            "id": 12345,
-            "name": "New Name",
-            "type": "metric alert",
-            "overall_state": "OK",
-            "message": "Old message",
-            "tags": ["env:prod"],
-            "priority": 3,
-            "query": "avg(last_5m):avg:system.cpu.user{*} > 90",
-        }
-
-        with patch("datadog_mcp.utils.datadog_client.httpx.AsyncClient") as mock_client:
-            mock_get = MagicMock()
-            mock_get.json.return_value = mock_get_response
-            mock_get.raise_for_status = MagicMock()
-
-            mock_put = MagicMock()
-            mock_put.json.return_value = mock_put_response
-            mock_put.raise_for_status = MagicMock()
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_get
-            )
-            mock_client.return_value.__aenter__.return_value.put = AsyncMock(
-                return_value=mock_put
-            )
-
-            result = await datadog_client.update_monitor(12345, name="New Name")
-
-            assert isinstance(result, dict)
-            assert result["name"] == "New Name"
-
-    @pytest.mark.asyncio
-    async def test_update_monitor_multiple_fields(self):
+    async def test_update_monitor_multiple_fields(self, mock_transport):
         """Test updating multiple fields at once"""
-        mock_get_response = {
-            "id": 12345,
-            "name": "Old Name",
-            "type": "metric alert",
-            "overall_state": "OK",
-            "message": "Old message",
-            "tags": ["env:prod"],
-            "priority": 3,
-            "query": "test query",
-        }
-
-        mock_put_response = {
-            "id": 12345,
-            "name": "New Name",
-            "type": "metric alert",
-            "overall_state": "OK",
-            "message": "New message",
-            "tags": ["env:staging", "team:infra"],
-            "priority": 1,
-            "query": "test query",
-        }
-
-        with patch("datadog_mcp.utils.datadog_client.httpx.AsyncClient") as mock_client:
-            mock_get = MagicMock()
-            mock_get.json.return_value = mock_get_response
-            mock_get.raise_for_status = MagicMock()
-
-            mock_put = MagicMock()
-            mock_put.json.return_value = mock_put_response
-            mock_put.raise_for_status = MagicMock()
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_get
-            )
-            mock_client.return_value.__aenter__.return_value.put = AsyncMock(
-                return_value=mock_put
-            )
-
-            result = await datadog_client.update_monitor(
-                12345,
-                name="New Name",
-                message="New message",
-                tags=["env:staging", "team:infra"],
-                priority=1,
-            )
-
-            assert result["name"] == "New Name"
-            assert result["message"] == "New message"
-            assert result["priority"] == 1
-
-    @pytest.mark.asyncio
-    async def test_update_monitor_api_error(self):
+        put_bodies = []
+
+        def handler(request):
+            if request.method == "PUT":
+                put_bodies.append(json.loads(request.content))
+                return httpx.Response(200, json=put_bodies[-1])
+            return httpx.Response(200, json=_BASE_MONITOR)
+
+        mock_transport(handler)
+
+        result = await datadog_client.update_monitor(
+            12345,
+            name="New Name",
+            message="New message",
+            tags=["env:staging", "team:infra"],
+            priority=1,
+        )
+
+        assert result["name"] == "New Name"
+        assert result["message"] == "New message"
+        assert result["priority"] == 1
+        assert put_bodies[0]["tags"] == ["env:staging", "team:infra"]
+        assert put_bodies[0]["query"] == _BASE_MONITOR["query"]
+
+    async def test_update_monitor_api_error(self, mock_transport):
         """Test update_monitor handles API errors"""
-        with patch("datadog_mcp.utils.datadog_client.httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "Not Found",
-                request=MagicMock(),
-                response=MagicMock(status_code=404),
-            )
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_transport(lambda request: httpx.Response(404, json={"errors": ["Not Found"]}))
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await datadog_client.update_monitor(99999999, name="Test")
+        with pytest.raises(httpx.HTTPStatusError):
+            await datadog_client.update_monitor(99999999, name="Test")
 
 
+@module_loop
 class TestMonitorEditHandlers:
     """Test monitor_edit tool handlers"""
 
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_name(self):
-        """Test successful monitor name update"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "name": "New Monitor Name"}
-
-        mock_result = {
-            "id": 12345,
-            "name": "New Monitor Name",
-        }
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = mock_result
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            assert "12345" in result.content[0].text
-            assert "updated successfully" in result.content[0].text.lower()
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_message(self):
-        """Test successful monitor message update"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "message": "New alert message"}
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            mock_update.assert_called_once_with(12345, message="New alert message")
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_tags(self):
-        """Test successful monitor tags update"""
-        mock_request = MagicMock()
-        mock_request.arguments = {
-            "monitor_id": 12345,
-            "tags": ["env:prod", "team:backend"],
-        }
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            mock_update.assert_called_once_with(
-                12345, tags=["env:prod", "team:backend"]
-            )
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_priority(self):
-        """Test successful monitor priority update"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "priority": 1}
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            mock_update.assert_called_once_with(12345, priority=1)
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_multiple_fields(self):
-        """Test successful update of multiple fields"""
-        mock_request = MagicMock()
-        mock_request.arguments = {
+    async def test_handle_monitor_edit_success(self, mock_update):
+        """Test successful updates forward exactly the given fields"""
+        results = await asyncio.gather(*(
+            monitor_edit.handle_call(SimpleNamespace(arguments={"monitor_id": 12345, **fields}))
+            for _, fields in _SUCCESS_CASES
+        ))
+
+        calls = mock_update.call_args_list
+        for (case_id, fields), result, call in zip(_SUCCESS_CASES, results, calls, strict=True):
+            assert isinstance(result, CallToolResult), case_id
+            assert result.isError is False, case_id
+            assert "12345" in result.content[0].text, case_id
+            assert "updated successfully" in result.content[0].text.lower(), case_id
+            assert call.args == (12345,), case_id
+            assert call.kwargs == fields, case_id
+
+    async def test_handle_monitor_edit_null_optional_fields(self, mock_update):
+        """Test null optional fields are skipped rather than rejected"""
+        mock_request = SimpleNamespace(arguments={
             "monitor_id": 12345,
             "name": "New Name",
-            "message": "New message",
-            "tags": ["env:staging"],
-            "priority": 2,
-        }
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            mock_update.assert_called_once_with(
-                12345,
-                name="New Name",
-                message="New message",
-                tags=["env:staging"],
-                priority=2,
-            )
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_query_only(self):
-        """Test successful monitor query-only update"""
-        mock_request = MagicMock()
-        mock_request.arguments = {
-            "monitor_id": 12345,
-            "query": "avg(last_5m):avg:system.cpu.user{*} > 95",
-        }
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            mock_update.assert_called_once_with(
-                12345, query="avg(last_5m):avg:system.cpu.user{*} > 95"
-            )
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_success_query_with_other_fields(self):
-        """Test successful update of query with other fields"""
-        mock_request = MagicMock()
-        mock_request.arguments = {
-            "monitor_id": 12345,
-            "name": "Updated Monitor",
-            "query": "avg(last_10m):avg:system.memory.used{*} > 80",
-        }
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
-            mock_update.assert_called_once_with(
-                12345,
-                name="Updated Monitor",
-                query="avg(last_10m):avg:system.memory.used{*} > 80",
-            )
-
-    @pytest.mark.asyncio
+            "tags": None,
+            "priority": None,
+        })
+
+        result = await monitor_edit.handle_call(mock_request)
+
+        assert result.isError is False
+        _assert_updated(mock_update, name="New Name")
+
     async def test_handle_monitor_edit_missing_monitor_id(self):
         """Test error when monitor_id is missing"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"name": "New Name"}
+        mock_request = SimpleNamespace(arguments={"name": "New Name"})
 
         result = await monitor_edit.handle_call(mock_request)
 
@@ -378,11 +233,39 @@ class TestMonitorEditHandlers:
         assert result.isError is True
         assert "monitor_id" in result.content[0].text.lower()
 
-    @pytest.mark.asyncio
+    async def test_handle_monitor_edit_invalid_monitor_id(self, mock_update):
+        """Test a non-integer monitor ID is rejected without an API call"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": "12345", "name": "New Name"})
+
+        result = await monitor_edit.handle_call(mock_request)
+
+        assert result.isError is True
+        assert "monitor_id" in result.content[0].text
+        mock_update.assert_not_called()
+
+    async def test_handle_monitor_edit_schema_violation(self, mock_update):
+        """Test arguments rejected by the input schema never reach Datadog"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "tags": "env:prod"})
+
+        result = await monitor_edit.handle_call(mock_request)
+
+        assert result.isError is True
+        assert result.content[0].text.startswith("Invalid arguments:")
+        mock_update.assert_not_called()
+
+    async def test_handle_monitor_edit_schema_errors_are_shared(self):
+        """Test repeated schema violations reuse the same error result"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "priority": 6})
+
+        first = await monitor_edit.handle_call(mock_request)
+        second = await monitor_edit.handle_call(mock_request)
+
+        assert first.isError is True
+        assert first is second
+
     async def test_handle_monitor_edit_none_arguments(self):
         """Test error when arguments is None"""
-        mock_request = MagicMock()
-        mock_request.arguments = None
+        mock_request = SimpleNamespace(arguments=None)
 
         result = await monitor_edit.handle_call(mock_request)
 
@@ -390,11 +273,9 @@ class TestMonitorEditHandlers:
         assert result.isError is True
         assert "monitor_id" in result.content[0].text.lower()
 
-    @pytest.mark.asyncio
     async def test_handle_monitor_edit_no_update_fields(self):
         """Test error when no update fields are provided"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345}
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345})
 
         result = await monitor_edit.handle_call(mock_request)
 
@@ -402,179 +283,133 @@ class TestMonitorEditHandlers:
         assert result.isError is True
         assert "at least one field" in result.content[0].text.lower()
 
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_api_error(self):
+    async def test_handle_monitor_edit_api_error(self, mock_update):
         """Test error handling when API call fails"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "name": "New Name"}
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "name": "New Name"})
 
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.side_effect = Exception("API error")
+        mock_update.side_effect = Exception("API error")
 
-            result = await monitor_edit.handle_call(mock_request)
+        result = await monitor_edit.handle_call(mock_request)
 
-            assert isinstance(result, CallToolResult)
-            assert result.isError is True
-            assert "error" in result.content[0].text.lower()
+        assert isinstance(result, CallToolResult)
+        assert result.isError is True
+        assert "error" in result.content[0].text.lower()
 
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_not_found(self):
+    async def test_handle_monitor_edit_not_found(self, mock_update):
         """Test handling of monitor not found (404)"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 99999999, "name": "New Name"}
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_response = MagicMock()
-            mock_response.status_code = 404
-            mock_update.side_effect = httpx.HTTPStatusError(
-                "Not Found",
-                request=MagicMock(),
-                response=mock_response,
-            )
-
-            result = await monitor_edit.handle_call(mock_request)
-
-            assert isinstance(result, CallToolResult)
-            assert result.isError is True
-            assert "not found" in result.content[0].text.lower()
-
-    @pytest.mark.asyncio
-    async def test_handle_monitor_edit_permission_denied(self):
-        """Test handling of permission denied (403)"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "name": "New Name"}
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_response = MagicMock()
-            mock_response.status_code = 403
-            mock_update.side_effect = httpx.HTTPStatusError(
-                "Forbidden",
-                request=MagicMock(),
-                response=mock_response,
-            )
+        mock_request = SimpleNamespace(arguments={"monitor_id": 99999999, "name": "New Name"})
 
-            result = await monitor_edit.handle_call(mock_request)
+        mock_update.side_effect = _http_error(404)
 
-            assert isinstance(result, CallToolResult)
-            assert result.isError is True
-            assert "permission denied" in result.content[0].text.lower()
+        result = await monitor_edit.handle_call(mock_request)
 
+        assert isinstance(result, CallToolResult)
+        assert result.isError is True
+        assert "not found" in result.content[0].text.lower()
 
-class TestMonitorEditValidation:
-    """Test monitor_edit input validation"""
+    async def test_handle_monitor_edit_permission_denied(self, mock_update):
+        """Test handling of permission denied (403)"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "name": "New Name"})
 
-    @pytest.mark.asyncio
-    async def test_invalid_priority_too_low(self):
-        """Test error when priority is below 1"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "priority": 0}
+        mock_update.side_effect = _http_error(403)
 
         result = await monitor_edit.handle_call(mock_request)
 
         assert isinstance(result, CallToolResult)
         assert result.isError is True
-        assert "priority" in result.content[0].text.lower()
+        assert "permission denied" in result.content[0].text.lower()
 
-    @pytest.mark.asyncio
-    async def test_invalid_priority_too_high(self):
-        """Test error when priority is above 5"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "priority": 6}
+    async def test_handle_monitor_edit_timeout(self, mock_update):
+        """Test handling of request timeouts"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "name": "New Name"})
+
+        mock_update.side_effect = httpx.WriteTimeout("timed out")
 
         result = await monitor_edit.handle_call(mock_request)
 
         assert isinstance(result, CallToolResult)
         assert result.isError is True
-        assert "priority" in result.content[0].text.lower()
+        assert result.content[0].text == "Request timed out"
 
-    @pytest.mark.asyncio
-    async def test_invalid_priority_negative(self):
-        """Test error when priority is negative"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "priority": -1}
 
-        result = await monitor_edit.handle_call(mock_request)
+class TestMonitorEditValidation:
+    """Test monitor_edit input validation"""
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {"monitor_id": 12345},
+            {"monitor_id": 12345, "name": "", "tags": []},
+            {"monitor_id": 12345, "priority": 5, "query": "avg(last_5m):avg:system.cpu.user{*} > 90"},
+        ],
+    )
+    def test_schema_accepts(self, validate, arguments):
+        """Test the compiled validator accepts arguments matching the schema"""
+        assert validate(arguments) is None
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {},
+            {"monitor_id": "12345"},
+            {"monitor_id": 0},
+            {"monitor_id": 12345.0},
+            {"monitor_id": 12345, "priority": 6},
+            {"monitor_id": 12345, "tags": [1]},
+            {"monitor_id": 12345, "unknown": "x"},
+        ],
+    )
+    def test_schema_rejects(self, validate, arguments):
+        """Test the compiled validator rejects arguments violating the schema"""
+        result = validate(arguments)
 
         assert isinstance(result, CallToolResult)
         assert result.isError is True
-        assert "priority" in result.content[0].text.lower()
-
-    @pytest.mark.asyncio
-    async def test_valid_priority_min(self):
-        """Test valid priority at minimum (1)"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "priority": 1}
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
 
-            result = await monitor_edit.handle_call(mock_request)
+    @module_loop
+    @pytest.mark.parametrize("priority", [0, -1, 6, 100])
+    async def test_invalid_priority(self, mock_update, priority):
+        """Test error when priority is outside 1-5"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "priority": priority})
 
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
+        result = await monitor_edit.handle_call(mock_request)
 
-    @pytest.mark.asyncio
-    async def test_valid_priority_max(self):
-        """Test valid priority at maximum (5)"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "priority": 5}
+        assert isinstance(result, CallToolResult)
+        assert result.isError is True
+        assert "priority" in result.content[0].text.lower()
+        mock_update.assert_not_called()
 
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
+    @module_loop
+    @pytest.mark.parametrize("priority", [1, 5])
+    async def test_valid_priority(self, mock_update, priority):
+        """Test valid priority at the bounds of 1-5"""
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "priority": priority})
 
-            result = await monitor_edit.handle_call(mock_request)
+        result = await monitor_edit.handle_call(mock_request)
 
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
+        assert isinstance(result, CallToolResult)
+        assert result.isError is False
+        _assert_updated(mock_update, priority=priority)
 
-    @pytest.mark.asyncio
-    async def test_empty_name_is_valid(self):
+    @module_loop
+    async def test_empty_name_is_valid(self, mock_update):
         """Test that empty string name is accepted (may be valid for API)"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "name": ""}
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "name": ""})
 
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
-
-            result = await monitor_edit.handle_call(mock_request)
+        result = await monitor_edit.handle_call(mock_request)
 
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
+        assert isinstance(result, CallToolResult)
+        assert result.isError is False
 
-    @pytest.mark.asyncio
-    async def test_empty_tags_list_is_valid(self):
+    @module_loop
+    async def test_empty_tags_list_is_valid(self, mock_update):
         """Test that empty tags list is accepted"""
-        mock_request = MagicMock()
-        mock_request.arguments = {"monitor_id": 12345, "tags": []}
-
-        with patch(
-            "datadog_mcp.tools.monitor_edit.update_monitor",
-            new_callable=AsyncMock,
-        ) as mock_update:
-            mock_update.return_value = {"id": 12345}
+        mock_request = SimpleNamespace(arguments={"monitor_id": 12345, "tags": []})
 
-            result = await monitor_edit.handle_call(mock_request)
+        result = await monitor_edit.handle_call(mock_request)
 
-            assert isinstance(result, CallToolResult)
-            assert result.isError is False
+        assert isinstance(result, CallToolResult)
+        assert result.isError is False
 
 
 if __name__ == "__main__":